@@ -1,3 +1,13 @@
+import math
+
+
+def format_value_cell(value, width):
+    """Format a matrix value as a table cell, showing N/A for missing (NaN or text) values."""
+    if isinstance(value, str) or (isinstance(value, float) and math.isnan(value)):
+        return f" {'N/A':<{width}} |"
+    return f" {value:<{width}.4f} |"
+
+
 def print_q2s_matrix(q2s_matrix):
     """
     Print the basic Q2S matrix with quality goals only.
@@ -21,39 +31,35 @@ def print_q2s_matrix(q2s_matrix):
     plan_id_width = 10
     qg_width = 10
 
-    # Print top header row
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (qg_width + 2) for _ in qg_ids]) + "+")
+    # Separator line, used for the top, header and bottom borders
+    separator = ("+" + "-" * (plan_id_width + 2) + "+" +
+                 "+".join(["-" * (qg_width + 2) for _ in qg_ids]) + "+")
+    lines = [separator]
 
-    # Print column names
-    header = f"| {'Plan ID':<{plan_id_width}} |"
-    for qg_id in qg_ids:
-        header += f" {qg_id:<{qg_width}} |"
-    print(header)
+    # Add column names
+    header = [f"| {'Plan ID':<{plan_id_width}} |"]
+    header.extend(f" {qg_id:<{qg_width}} |" for qg_id in qg_ids)
+    lines.append("".join(header))
 
-    # Print separator line
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (qg_width + 2) for _ in qg_ids]) + "+")
+    # Add separator line
+    lines.append(separator)
 
-    # Print data for each plan
+    # Add data for each plan
     for plan_id in q2s_matrix["plans"]:
         plan_data = q2s_matrix["matrix"].get(plan_id, {})
 
-        row = f"| {plan_id:<{plan_id_width}} |"
+        row = [f"| {plan_id:<{plan_id_width}} |"]
 
         # Add each quality goal value
-        for qg_id in qg_ids:
-            value = plan_data.get(qg_id, float('nan'))
-            if not isinstance(value, str) and not (isinstance(value, float) and value != value):  # Check for NaN
-                row += f" {value:<{qg_width}.4f} |"
-            else:
-                row += f" {'N/A':<{qg_width}} |"
+        row.extend(format_value_cell(plan_data.get(qg_id, float('nan')), qg_width) for qg_id in qg_ids)
+
+        lines.append("".join(row))
 
-        print(row)
+    # Add final row
+    lines.append(separator)
 
-    # Print final row
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (qg_width + 2) for _ in qg_ids]) + "+")
+    # Print the whole table at once
+    print("\n".join(lines))
 
 def print_ext_q2s_matrix(q2s_matrix_extended):
     """
@@ -79,52 +85,40 @@ def print_ext_q2s_matrix(q2s_matrix_extended):
     qg_width = 10
     stat_width = 10
 
-    # Print top header row
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (qg_width + 2) for _ in qg_ids]) + "+" +
-          "+".join(["-" * (stat_width + 2) for _ in extended_cols]) + "+")
-
-    # Print column names
-    header = f"| {'Plan ID':<{plan_id_width}} |"
-    for qg_id in qg_ids:
-        header += f" {qg_id:<{qg_width}} |"
-    for col in extended_cols:
-        header += f" {col:<{stat_width}} |"
-    print(header)
-
-    # Print separator line
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (qg_width + 2) for _ in qg_ids]) + "+" +
-          "+".join(["-" * (stat_width + 2) for _ in extended_cols]) + "+")
-
-    # Print data for each plan
+    # Separator line, used for the top, header and bottom borders
+    separator = ("+" + "-" * (plan_id_width + 2) + "+" +
+                 "+".join(["-" * (qg_width + 2) for _ in qg_ids]) + "+" +
+                 "+".join(["-" * (stat_width + 2) for _ in extended_cols]) + "+")
+    lines = [separator]
+
+    # Add column names
+    header = [f"| {'Plan ID':<{plan_id_width}} |"]
+    header.extend(f" {qg_id:<{qg_width}} |" for qg_id in qg_ids)
+    header.extend(f" {col:<{stat_width}} |" for col in extended_cols)
+    lines.append("".join(header))
+
+    # Add separator line
+    lines.append(separator)
+
+    # Add data for each plan
     for plan_id in q2s_matrix_extended["plans"]:
         plan_data = q2s_matrix_extended["matrix"].get(plan_id, {})
 
-        row = f"| {plan_id:<{plan_id_width}} |"
+        row = [f"| {plan_id:<{plan_id_width}} |"]
 
         # Add each quality goal value
-        for qg_id in qg_ids:
-            value = plan_data.get(qg_id, float('nan'))
-            if not isinstance(value, str) and not (isinstance(value, float) and value != value):  # Check for NaN
-                row += f" {value:<{qg_width}.4f} |"
-            else:
-                row += f" {'N/A':<{qg_width}} |"
+        row.extend(format_value_cell(plan_data.get(qg_id, float('nan')), qg_width) for qg_id in qg_ids)
 
         # Add extended statistics values
-        for col in extended_cols:
-            value = plan_data.get(col, float('nan'))
-            if not isinstance(value, str) and not (isinstance(value, float) and value != value):  # Check for NaN
-                row += f" {value:<{stat_width}.4f} |"
-            else:
-                row += f" {'N/A':<{stat_width}} |"
+        row.extend(format_value_cell(plan_data.get(col, float('nan')), stat_width) for col in extended_cols)
 
-        print(row)
+        lines.append("".join(row))
 
-    # Print final row
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (qg_width + 2) for _ in qg_ids]) + "+" +
-          "+".join(["-" * (stat_width + 2) for _ in extended_cols]) + "+")
+    # Add final row
+    lines.append(separator)
+
+    # Print the whole table at once
+    print("\n".join(lines))
 
 
 
@@ -178,31 +172,32 @@ def print_plan_impacts(plan_impacts):
     plan_id_width = 10
     var_width = 12
 
-    # Print header row
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (var_width + 2) for _ in all_domain_vars]) + "+")
+    # Separator line, used for the top, header and bottom borders
+    separator = ("+" + "-" * (plan_id_width + 2) + "+" +
+                 "+".join(["-" * (var_width + 2) for _ in all_domain_vars]) + "+")
+    lines = [separator]
 
-    # Print column names
-    header = f"| {'Plan ID':<{plan_id_width}} |"
-    for var in all_domain_vars:
-        header += f" {var:<{var_width}} |"
-    print(header)
+    # Add column names
+    header = [f"| {'Plan ID':<{plan_id_width}} |"]
+    header.extend(f" {var:<{var_width}} |" for var in all_domain_vars)
+    lines.append("".join(header))
 
-    # Print separator line
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (var_width + 2) for _ in all_domain_vars]) + "+")
+    # Add separator line
+    lines.append(separator)
 
-    # Print data for each plan
+    # Add data for each plan
     for plan_id, impacts in formatted_impacts.items():
-        row = f"| {plan_id:<{plan_id_width}} |"
+        row = [f"| {plan_id:<{plan_id_width}} |"]
         for var in all_domain_vars:
             impact = impacts.get(var, 0)
-            row += f" {impact:<{var_width}.2f} |"
-        print(row)
+            row.append(f" {impact:<{var_width}.2f} |")
+        lines.append("".join(row))
+
+    # Add final row
+    lines.append(separator)
 
-    # Print final row
-    print("+" + "-" * (plan_id_width + 2) + "+" +
-          "+".join(["-" * (var_width + 2) for _ in all_domain_vars]) + "+")
+    # Print the whole table at once
+    print("\n".join(lines))
 
     print(f"\nDisplayed impacts for {len(plan_impacts)} plans")
 
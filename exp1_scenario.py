@@ -18,7 +18,35 @@ from exp1_log import (
     print_ext_q2s_matrix
 )
 
-def process_scenario(config, scenario, alpha, verbose=False):
+def load_scenario_data(config):
+    """
+    Load plans and contributions and calculate the impact of every plan.
+
+    The result only depends on the configuration, so it can be computed once
+    and shared by all the scenarios of a simulation.
+
+    Args:
+        config (dict): Configuration loaded from JSON
+
+    Returns:
+        tuple: (plans, plan_impacts), or (None, None) if loading failed
+    """
+    plans = load_plans(config["file_paths"]["plans"])
+    contributions = load_contributions(config["file_paths"]["contributions"])
+
+    if plans is None or contributions is None:
+        print("Failed to load plans or contributions")
+        return None, None
+
+    plan_impacts = {}
+    for plan_id, plan in plans.items():
+        impact = calculate_plan_impact(plan, contributions)
+        plan_impacts[plan_id] = impact
+
+    return plans, plan_impacts
+
+
+def process_scenario(config, scenario, alpha, verbose=False, plans=None, plan_impacts=None):
     """
     Process a scenario with the given configuration and constraints.
 
@@ -27,6 +55,8 @@ def process_scenario(config, scenario, alpha, verbose=False):
         scenario (dict): Scenario with constraints and perturbation levels
         alpha (float): Alpha value for Q2S score calculation
         verbose (bool): Whether to print detailed information
+        plans (dict): Plans from load_scenario_data (loaded from config if None)
+        plan_impacts (dict): Plan impacts from load_scenario_data (calculated if None)
 
     Returns:
         dict: Results of the scenario including success rates and margins
@@ -67,19 +97,12 @@ def process_scenario(config, scenario, alpha, verbose=False):
         print(f"Processing scenario with alpha={alpha}")
         print("="*80)
 
-    # 1. Load plans and contributions
-    plans = load_plans(config["file_paths"]["plans"])
-    contributions = load_contributions(config["file_paths"]["contributions"])
+    # 1-2. Load plans and contributions and calculate impact for all plans
+    if plans is None or plan_impacts is None:
+        plans, plan_impacts = load_scenario_data(config)
 
-    if plans is None or contributions is None:
-        print("Failed to load plans or contributions")
-        return None
-
-    # 2. Calculate impact for all plans
-    plan_impacts = {}
-    for plan_id, plan in plans.items():
-        impact = calculate_plan_impact(plan, contributions)
-        plan_impacts[plan_id] = impact
+        if plans is None:
+            return None
 
     if verbose:
         print_plan_impacts(plan_impacts)
@@ -127,20 +150,22 @@ def process_scenario(config, scenario, alpha, verbose=False):
     # 6.1 Q2S strategy (using Score)
     q2s_plan_id = q2s_selection_strategy_extended(q2s_matrix_extended)
 
-    # 6.2 AvgSat strategy (find plan with highest AvgSat)
+    # 6.2 AvgSat strategy (find plan with highest AvgSat) and
+    # 6.3 MinSat strategy (find plan with highest MinSat), in a single pass
     avg_plan_id = None
     highest_avg = float('-inf')
+    min_plan_id = None
+    highest_min = float('-inf')
+    matrix = q2s_matrix_extended["matrix"]
     for plan_id in q2s_matrix_extended["plans"]:
-        avg_sat = q2s_matrix_extended["matrix"][plan_id]["AvgSat"]
+        plan_row = matrix[plan_id]
+
+        avg_sat = plan_row["AvgSat"]
         if avg_sat > highest_avg:
             highest_avg = avg_sat
             avg_plan_id = plan_id
 
-    # 6.3 MinSat strategy (find plan with highest MinSat)
-    min_plan_id = None
-    highest_min = float('-inf')
-    for plan_id in q2s_matrix_extended["plans"]:
-        min_sat = q2s_matrix_extended["matrix"][plan_id]["MinSat"]
+        min_sat = plan_row["MinSat"]
         if min_sat > highest_min:
             highest_min = min_sat
             min_plan_id = plan_id
@@ -213,6 +238,11 @@ def check_plan_with_margins(plan_id, plan_impacts, perturbed_quality_goals):
     if not is_valid:
         return False, 0
 
+    # Index the plan impact by domain variable once (first occurrence wins)
+    impact_values = {}
+    for item in plan_impact:
+        impact_values.setdefault(item["domain_variable"], item["value"])
+
     # Calculate margins (average remaining satisfaction distance)
     margins = []
     for goal in perturbed_quality_goals:
@@ -220,11 +250,7 @@ def check_plan_with_margins(plan_id, plan_impacts, perturbed_quality_goals):
         constraint = goal["constraint"]
 
         # Find the actual value for this domain variable
-        actual_value = None
-        for item in plan_impact:
-            if item["domain_variable"] == domain_var:
-                actual_value = item["value"]
-                break
+        actual_value = impact_values.get(domain_var)
 
         if actual_value is not None and constraint > 0:  # Avoid division by zero
             margin = (constraint - actual_value) / constraint
@@ -276,17 +302,20 @@ def get_constraint_options(scenario):
         value = scenario.get(key)
 
         # Get perturbation value (or default to 0 if not specified)
-        perturb_value_str = perturbation_levels.get(key, "0")
+        raw_value = perturbation_levels.get(key, "0")
 
-        # Convert perturbation value to integer or float
-        try:
-            perturb_value = int(perturb_value_str)
-        except ValueError:
+        # Convert perturbation value to integer or float (already-numeric values need no parsing)
+        if isinstance(raw_value, (int, float)):
+            perturb_value = raw_value
+        else:
             try:
-                perturb_value = float(perturb_value_str)
+                perturb_value = int(raw_value)
             except ValueError:
-                print(f"Warning: Invalid perturbation value '{perturb_value_str}' for {key}, using 0")
-                perturb_value = 0
+                try:
+                    perturb_value = float(raw_value)
+                except ValueError:
+                    print(f"Warning: Invalid perturbation value '{raw_value}' for {key}, using 0")
+                    perturb_value = 0
 
         # Create constraint option
         constraint_option = {
@@ -11,7 +11,7 @@ import csv
 import json
 import itertools
 from q2s_utils import load_json_config
-from exp1_scenario import process_scenario, get_constraint_options
+from exp1_scenario import process_scenario, get_constraint_options, load_scenario_data
 
 def generate_all_scenarios(config):
     """
@@ -65,7 +65,7 @@ def generate_all_scenarios(config):
                 # Add perturbation value
                 perturbation_level = {}
                 for i, domain_var in enumerate(domain_variables):
-                    perturbation_level[domain_var] = str(perturbations[i])
+                    perturbation_level[domain_var] = perturbations[i]
 
 
                 scenario["perturbation_level"] = perturbation_level
@@ -91,6 +91,11 @@ def simulate_all_scenarios(config_file):
         print(f"Failed to load configuration from {config_file}")
         return False
 
+    # Load plans and plan impacts once, they are shared by all scenarios
+    plans, plan_impacts = load_scenario_data(config)
+    if plans is None:
+        return False
+
     # Generate all possible scenarios
     print("Generating all possible scenarios...")
     scenarios = generate_all_scenarios(config)
@@ -138,7 +143,8 @@ def simulate_all_scenarios(config_file):
 
             # Process scenario
             alpha = scenario["alpha"]
-            results = process_scenario(config, scenario, alpha, verbose=False)
+            results = process_scenario(config, scenario, alpha, verbose=False,
+                                       plans=plans, plan_impacts=plan_impacts)
 
             if results is None:
                 print(f"Failed to process scenario {scenario['id']}")
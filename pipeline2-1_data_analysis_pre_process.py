@@ -24,6 +24,14 @@ import pandas as pd
 import numpy as np
 import os
 from pathlib import Path
+from q2s_utils import (
+    load_scenarios, save_scenarios, get_file_cache_key, read_cached_frame, write_cached_frame
+)
+
+
+# Part of the pre-processing cache key: bump it whenever preprocess_scenarios
+# changes its output, so results cached by older code are not reused
+PREPROCESS_CACHE_VERSION = 1
 
 
 def load_config(config_file):
@@ -45,36 +53,54 @@ def get_domain_variables(config):
     return domain_variables
 
 
-def calculate_strategy_metrics(df, strategy_prefix):
-    """Calculate metrics for a given strategy."""
-    success_col = f"{strategy_prefix}_success"
-    margins_col = f"{strategy_prefix}_margins"
+def masked_row_mean(values, mask, empty):
+    """Row-wise mean of the masked cells of a 2D array, as one masked sum and count.
+
+    Rows without any masked cell get the value `empty`.
+    """
+    sums = np.where(mask, values, 0.0).sum(axis=1)
+    counts = mask.sum(axis=1)
+    return np.divide(sums, counts, out=np.full_like(sums, empty), where=counts > 0)
+
+
+def calculate_strategy_metrics(df, strategy_prefixes):
+    """Calculate metrics for all given strategies with one reduction per metric."""
+    available = [
+        prefix for prefix in strategy_prefixes
+        if f"{prefix}_success" in df.columns and f"{prefix}_margins" in df.columns
+    ]
+    success_cols = [f"{prefix}_success" for prefix in available]
+    margins_cols = [f"{prefix}_margins" for prefix in available]
+
+    # (strategies x scenarios) arrays, so each strategy is one contiguous row
+    success_arr = np.ascontiguousarray(df[success_cols].to_numpy(dtype=float).T)
+    margins_arr = np.ascontiguousarray(df[margins_cols].to_numpy(dtype=float).T)
 
-    if success_col not in df.columns or margins_col not in df.columns:
-        return {
+    valid_success = ~np.isnan(success_arr)
+    valid_margins = ~np.isnan(margins_arr)
+
+    # Success rates, average margins, and average margins restricted to successful
+    # cases for every strategy at once (missing values are skipped)
+    success_rates = masked_row_mean(success_arr, valid_success, np.nan)
+    avg_margins = masked_row_mean(margins_arr, valid_margins, 0.0)
+    avg_margins_when_success = masked_row_mean(margins_arr, valid_margins & (success_arr == 1), 0.0)
+
+    metrics = {}
+    for prefix in strategy_prefixes:
+        metrics[prefix] = {
             'success_rate': 0.0,
             'avg_margin': 0.0,
             'avg_margin_when_success': 0.0
         }
 
-    # Calculate success rate
-    success_rate = df[success_col].mean()
-
-    # Get all margins (as single numeric values, not lists)
-    all_margins = df[margins_col].dropna().tolist()
-
-    # Get margins only for successful cases
-    success_margins = df[df[success_col] == 1][margins_col].dropna().tolist()
+    for i, prefix in enumerate(available):
+        metrics[prefix] = {
+            'success_rate': success_rates[i],
+            'avg_margin': avg_margins[i],
+            'avg_margin_when_success': avg_margins_when_success[i]
+        }
 
-    # Calculate average margins
-    avg_margin = np.mean(all_margins) if all_margins else 0.0
-    avg_margin_when_success = np.mean(success_margins) if success_margins else 0.0
-
-    return {
-        'success_rate': success_rate,
-        'avg_margin': avg_margin,
-        'avg_margin_when_success': avg_margin_when_success
-    }
+    return metrics
 
 
 def generate_scenarios_summary(preprocessed_df, output_dir):
@@ -99,8 +125,10 @@ def generate_scenarios_summary(preprocessed_df, output_dir):
         'Strategy': ['Success Rate', 'Avg Margin', 'Avg Margin (when success)']
     }
 
+    all_metrics = calculate_strategy_metrics(preprocessed_df, list(strategies.values()))
+
     for strategy_name, strategy_prefix in strategies.items():
-        metrics = calculate_strategy_metrics(preprocessed_df, strategy_prefix)
+        metrics = all_metrics[strategy_prefix]
 
         summary_data[strategy_name] = [
             metrics['success_rate'],
@@ -151,51 +179,44 @@ def preprocess_scenarios(scenarios_df, config):
     if missing_cols:
         raise ValueError(f"Missing columns in scenarios data: {missing_cols}")
 
-    # Initialize result dataframe
-    result_rows = []
-
-    # Group by scenario characteristics
-    grouped = scenarios_df.groupby(grouping_cols)
-
-    for group_key, group_df in grouped:
-        # Create new row for this group
-        new_row = {}
-
-        # Add the grouping columns
-        for i, col in enumerate(grouping_cols):
-            new_row[col] = group_key[i]
-
-        # Process ScorePlan columns for each alpha
-        alpha_values = sorted(group_df['alpha'].unique())
-        for alpha in alpha_values:
-            alpha_str = str(alpha).replace('.', '_')
-            alpha_row = group_df[group_df['alpha'] == alpha]
-
-            if not alpha_row.empty:
-                row = alpha_row.iloc[0]
-                new_row[f'Score{alpha_str}Plan_ID'] = row['ScorePlan_ID']
-                new_row[f'Score{alpha_str}Plan_success'] = row['ScorePlan_success']
-                new_row[f'Score{alpha_str}Plan_margins'] = row['ScorePlan_margins']
-            else:
-                # Handle missing alpha values
-                new_row[f'Score{alpha_str}Plan_ID'] = None
-                new_row[f'Score{alpha_str}Plan_success'] = None
-                new_row[f'Score{alpha_str}Plan_margins'] = None
-
-        # Add other plan columns (assuming they're the same for all alphas)
-        first_row = group_df.iloc[0]
-        for prefix in ['AvgPlan', 'MinPlan', 'RndPlan']:
-            new_row[f'{prefix}_ID'] = first_row[f'{prefix}_ID']
-            new_row[f'{prefix}_success'] = first_row[f'{prefix}_success']
-            new_row[f'{prefix}_margins'] = first_row[f'{prefix}_margins']
-
-        result_rows.append(new_row)
-
-    # Create result dataframe
-    result_df = pd.DataFrame(result_rows)
+    # Score plan results: first row of each (scenario, alpha) pair, one column block per alpha
+    score_fields = ['ID', 'success', 'margins']
+    score_df = (
+        scenarios_df
+        .drop_duplicates(grouping_cols + ['alpha'])
+        .set_index(grouping_cols + ['alpha'])[[f'ScorePlan_{field}' for field in score_fields]]
+        .unstack('alpha')
+    )
+
+    # Sorted alpha values become Score{alpha}Plan_* columns
+    score_columns = {}
+    for alpha in np.unique(score_df.columns.get_level_values('alpha')):
+        alpha_str = str(alpha).replace('.', '_')
+        for field in score_fields:
+            score_columns[(f'ScorePlan_{field}', alpha)] = f'Score{alpha_str}Plan_{field}'
+
+    score_df = score_df[list(score_columns)]
+    score_df.columns = list(score_columns.values())
+
+    # unstack upcasts every column when an alpha is missing for some group;
+    # keep the original dtype for the columns that are complete
+    for (source_col, _), target_col in score_columns.items():
+        if score_df[target_col].notna().all():
+            score_df[target_col] = score_df[target_col].astype(scenarios_df[source_col].dtype)
+
+    # Add other plan columns (assuming they're the same for all alphas), taken from
+    # the first row of each group
+    other_cols = [f'{prefix}_{field}' for prefix in ['AvgPlan', 'MinPlan', 'RndPlan'] for field in score_fields]
+    other_df = (
+        scenarios_df
+        .drop_duplicates(grouping_cols)
+        .set_index(grouping_cols)[other_cols]
+    )
+
+    # Create result dataframe, one row per group sorted by the grouping columns
+    result_df = pd.concat([score_df, other_df], axis=1).sort_index().reset_index()
 
     # Add ID column
-    result_df.reset_index(drop=True, inplace=True)
     result_df.insert(0, 'ID', range(1, len(result_df) + 1))
 
     return result_df
@@ -209,6 +230,11 @@ def main():
         'config_file',
         help='Path to the configuration JSON file'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Ignore cached pre-processing results and recompute them'
+    )
 
     args = parser.parse_args()
 
@@ -224,19 +250,34 @@ def main():
     if not os.path.exists(scenarios_path):
         raise FileNotFoundError(f"Scenarios file not found: {scenarios_path}")
 
-    # Load scenarios data
-    print(f"Loading scenarios from: {scenarios_path}")
-    scenarios_df = pd.read_csv(scenarios_path)
+    # Pre-processing only depends on the configuration, the scenarios file and the
+    # code, so reuse the cached result while none of them has changed. The cache is
+    # a single file holding the latest result and its key, overwritten on a miss
+    cache_key = f"v{PREPROCESS_CACHE_VERSION}:{get_file_cache_key(args.config_file, scenarios_path)}"
+    cache_file = os.path.join(output_dir, '.cache', 'pre_processed.pkl')
+
+    preprocessed_df = None if args.force else read_cached_frame(cache_file, cache_key)
+
+    if preprocessed_df is not None:
+        print(f"Loading cached pre-processed scenarios from: {cache_file}")
+    else:
+        # Load scenarios data. This cache already covers the result of parsing
+        # scenarios.csv, so it is not also pickled next to the CSV file: on a miss
+        # the scenarios file has usually changed and that pickle would be stale too
+        print(f"Loading scenarios from: {scenarios_path}")
+        scenarios_df = load_scenarios(scenarios_path, use_cache=False)
+
+        print(f"Loaded {len(scenarios_df)} scenarios with columns: {list(scenarios_df.columns)}")
 
-    print(f"Loaded {len(scenarios_df)} scenarios with columns: {list(scenarios_df.columns)}")
+        # Preprocess the data
+        print("Pre-processing scenarios...")
+        preprocessed_df = preprocess_scenarios(scenarios_df, config)
 
-    # Preprocess the data
-    print("Pre-processing scenarios...")
-    preprocessed_df = preprocess_scenarios(scenarios_df, config)
+        write_cached_frame(cache_file, cache_key, preprocessed_df)
 
     # Save preprocessed data
     output_file = os.path.join(output_dir, 'pre_processed_scenarios.csv')
-    preprocessed_df.to_csv(output_file, index=False)
+    save_scenarios(preprocessed_df, output_file)
 
     print(f"Pre-processed data saved to: {output_file}")
     print(f"Generated {len(preprocessed_df)} grouped scenarios")
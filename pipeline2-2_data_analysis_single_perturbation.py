@@ -24,8 +24,10 @@ For all strategies: Min, Score_03, Score_05, Score_07, Avg, Rnd
 import argparse
 import json
 import pandas as pd
+import numpy as np
 import os
 from pathlib import Path
+from q2s_utils import load_scenarios, run_jobs
 
 
 def load_config(config_file):
@@ -60,7 +62,20 @@ def extract_quality_goal_name(domain_variable):
     return domain_variable
 
 
-def filter_single_perturbation(df, target_column, all_perturbation_columns):
+def get_zero_perturbation_matrix(df, all_perturbation_columns):
+    """Compute, once for all quality goals, which rows have perturbation = 0 in each column.
+
+    Args:
+        df: Input dataframe
+        all_perturbation_columns: List of all perturbation columns
+
+    Returns:
+        Boolean NumPy array (rows x perturbation columns), True where the perturbation is 0
+    """
+    return np.column_stack([(df[col] == 0).to_numpy() for col in all_perturbation_columns])
+
+
+def filter_single_perturbation(df, target_column, all_perturbation_columns, zero_matrix):
     """Filter dataframe to keep only rows with single perturbation or baseline.
 
     This includes:
@@ -71,74 +86,70 @@ def filter_single_perturbation(df, target_column, all_perturbation_columns):
         df: Input dataframe
         target_column: The perturbation column for the target quality goal
         all_perturbation_columns: List of all perturbation columns
+        zero_matrix: Zero-perturbation matrix of all perturbation columns
+                     (see get_zero_perturbation_matrix)
 
     Returns:
         Filtered dataframe
     """
-    # Start with all rows (target column can be any value)
-    condition = pd.Series([True] * len(df), index=df.index)
-
-    # Add conditions for other columns = 0
-    for col in all_perturbation_columns:
-        if col != target_column:
-            condition = condition & (df[col] == 0)
+    # The target column can be any value, all other columns must be 0
+    other_indices = [i for i, col in enumerate(all_perturbation_columns) if col != target_column]
+    condition = zero_matrix[:, other_indices].all(axis=1)
 
-    return df[condition].copy()
+    # Nothing to filter out, e.g. a single quality goal or other goals never perturbed
+    if condition.all():
+        return df
 
-
-def calculate_strategy_stats(group_df, strategy_prefix):
-    """Calculate success rate, average margin, and variance margin for a strategy."""
-    success_col = f"{strategy_prefix}_success"
-    margins_col = f"{strategy_prefix}_margins"
-
-    if success_col not in group_df.columns or margins_col not in group_df.columns:
-        return 0.0, 0.0, 0.0
-
-    # Success rate (percentage)
-    success_rate = (group_df[success_col].sum() / len(group_df)) * 100
-
-    # Average margin
-    avg_margin = group_df[margins_col].mean()
-
-    # Variance margin
-    var_margin = group_df[margins_col].var()
-
-    return success_rate, avg_margin, var_margin
+    return df[condition]
 
 
 def create_summary_table(filtered_df, perturbation_col, qg_name, tables_dir):
     """Create summary statistics table for a quality goal."""
 
-    # Group by perturbation value
-    grouped = filtered_df.groupby(perturbation_col)
-
-    summary_rows = []
-
-    for perturbation_value, group_df in grouped:
-        row = {'Perturbation': perturbation_value}
-
-        # Define strategies and their column prefixes
-        strategies = [
-            ('Min', 'MinPlan'),
-            ('Score_03', 'Score0_3Plan'),
-            ('Score_05', 'Score0_5Plan'),
-            ('Score_07', 'Score0_7Plan'),
-            ('Avg', 'AvgPlan'),
-            ('Rnd', 'RndPlan')
-        ]
-
-        # Calculate stats for each strategy
-        for strategy_name, column_prefix in strategies:
-            success_rate, avg_margin, var_margin = calculate_strategy_stats(group_df, column_prefix)
-
-            row[f'{strategy_name}_Success_Rate'] = success_rate
-            row[f'{strategy_name}_Average_Margin'] = avg_margin
-            row[f'{strategy_name}_Variance_Margin'] = var_margin
-
-        summary_rows.append(row)
+    # Define strategies and their column prefixes
+    strategies = [
+        ('Min', 'MinPlan'),
+        ('Score_03', 'Score0_3Plan'),
+        ('Score_05', 'Score0_5Plan'),
+        ('Score_07', 'Score0_7Plan'),
+        ('Avg', 'AvgPlan'),
+        ('Rnd', 'RndPlan')
+    ]
+
+    # Only strategies with both columns present can be summarized
+    available = [
+        (strategy_name, column_prefix) for strategy_name, column_prefix in strategies
+        if f"{column_prefix}_success" in filtered_df.columns and f"{column_prefix}_margins" in filtered_df.columns
+    ]
+    success_cols = [f"{column_prefix}_success" for _, column_prefix in available]
+    margins_cols = [f"{column_prefix}_margins" for _, column_prefix in available]
+
+    # Group by perturbation value and aggregate every strategy column at once
+    grouped = filtered_df.groupby(perturbation_col, observed=True)
+    group_sizes = grouped.size()
+    # Aggregating an empty column list raises, and no strategy would read the result
+    if available:
+        success_sums = grouped[success_cols].sum()
+        margins_stats = grouped[margins_cols].agg(['mean', 'var'])
+
+    summary_data = {'Perturbation': group_sizes.index.to_numpy()}
+
+    for strategy_name, column_prefix in strategies:
+        if (strategy_name, column_prefix) in available:
+            success_col = f"{column_prefix}_success"
+            margins_col = f"{column_prefix}_margins"
+
+            # Success rate (percentage), average and variance margin
+            summary_data[f'{strategy_name}_Success_Rate'] = (success_sums[success_col] / group_sizes).to_numpy() * 100
+            summary_data[f'{strategy_name}_Average_Margin'] = margins_stats[(margins_col, 'mean')].to_numpy()
+            summary_data[f'{strategy_name}_Variance_Margin'] = margins_stats[(margins_col, 'var')].to_numpy()
+        else:
+            summary_data[f'{strategy_name}_Success_Rate'] = 0.0
+            summary_data[f'{strategy_name}_Average_Margin'] = 0.0
+            summary_data[f'{strategy_name}_Variance_Margin'] = 0.0
 
     # Create summary dataframe
-    summary_df = pd.DataFrame(summary_rows)
+    summary_df = pd.DataFrame(summary_data)
 
     # Sort by perturbation value
     summary_df = summary_df.sort_values('Perturbation')
@@ -156,7 +167,28 @@ def create_summary_table(filtered_df, perturbation_col, qg_name, tables_dir):
     return summary_file, len(summary_df)
 
 
-def create_single_perturbation_tables(preprocessed_df, config, output_dir):
+def write_quality_goal_tables(filtered_df, perturbation_col, qg_name, tables_dir):
+    """Write the filtered and summary tables of one quality goal."""
+
+    # Save filtered table
+    output_file = os.path.join(tables_dir, f"scenarios_{qg_name}_single_perturbation.csv")
+    filtered_df.to_csv(output_file, index=False)
+
+    # Create summary table
+    summary_file, summary_rows = create_summary_table(
+        filtered_df, perturbation_col, qg_name, tables_dir
+    )
+
+    return {
+        'file': output_file,
+        'rows': len(filtered_df),
+        'perturbation_column': perturbation_col,
+        'summary_file': summary_file,
+        'summary_rows': summary_rows
+    }
+
+
+def create_single_perturbation_tables(preprocessed_df, config, output_dir, jobs=1):
     """Create filtered tables for each quality goal."""
 
     # Get all perturbation columns
@@ -166,10 +198,23 @@ def create_single_perturbation_tables(preprocessed_df, config, output_dir):
     tables_dir = os.path.join(output_dir, 'tables')
     os.makedirs(tables_dir, exist_ok=True)
 
+    # Cast the low-cardinality perturbation columns to ordered categoricals once,
+    # so the per-quality-goal filters and groupbys work on integer codes
+    preprocessed_df = preprocessed_df.astype({
+        col: pd.CategoricalDtype(np.unique(preprocessed_df[col].to_numpy()), ordered=True)
+        for col in perturbation_columns
+        if col in preprocessed_df.columns
+    })
+
+    # The zero-perturbation matrix is shared by the filters of all quality goals
+    zero_matrix = get_zero_perturbation_matrix(preprocessed_df, perturbation_columns)
+
     # Get quality goals
     quality_goals = config.get('quality_goals', [])
 
-    results = {}
+    # The tables of each quality goal are independent: filter them here and
+    # collect one writing job per quality goal
+    table_jobs = []
 
     for qg in quality_goals:
         domain_variable = qg.get('column_name', qg.get('domain_variable'))
@@ -187,30 +232,26 @@ def create_single_perturbation_tables(preprocessed_df, config, output_dir):
         filtered_df = filter_single_perturbation(
             preprocessed_df,
             perturbation_col,
-            perturbation_columns
+            perturbation_columns,
+            zero_matrix
         )
 
         # Get quality goal name for filename
         qg_name = extract_quality_goal_name(domain_variable)
 
-        # Save filtered table
-        output_file = os.path.join(tables_dir, f"scenarios_{qg_name}_single_perturbation.csv")
-        filtered_df.to_csv(output_file, index=False)
-
-        # Create summary table
-        summary_file, summary_rows = create_summary_table(
-            filtered_df, perturbation_col, qg_name, tables_dir
-        )
-
-        results[qg_name] = {
-            'file': output_file,
-            'rows': len(filtered_df),
-            'perturbation_column': perturbation_col,
-            'summary_file': summary_file,
-            'summary_rows': summary_rows
-        }
+        table_jobs.append((qg_name, filtered_df, perturbation_col))
 
-        print(f"Created {qg_name}_single_perturbation.csv with {len(filtered_df)} rows")
+    results = {}
+    outputs = run_jobs(
+        [
+            (write_quality_goal_tables, filtered_df, perturbation_col, qg_name, tables_dir)
+            for qg_name, filtered_df, perturbation_col in table_jobs
+        ],
+        jobs
+    )
+    for (qg_name, _, _), result in zip(table_jobs, outputs):
+        results[qg_name] = result
+        print(f"Created {qg_name}_single_perturbation.csv with {result['rows']} rows")
 
     return results
 
@@ -223,6 +264,12 @@ def main():
         'config_file',
         help='Path to the configuration JSON file'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes used to write the tables (default: 1, written inline)'
+    )
 
     args = parser.parse_args()
 
@@ -239,14 +286,14 @@ def main():
 
     # Load preprocessed data
     print(f"Loading pre-processed scenarios from: {preprocessed_file}")
-    preprocessed_df = pd.read_csv(preprocessed_file)
+    preprocessed_df = load_scenarios(preprocessed_file)
 
     print(f"Loaded {len(preprocessed_df)} pre-processed scenarios")
     print(f"Columns: {list(preprocessed_df.columns)}")
 
     # Create single perturbation tables
     print("\nCreating single perturbation tables...")
-    results = create_single_perturbation_tables(preprocessed_df, config, output_dir)
+    results = create_single_perturbation_tables(preprocessed_df, config, output_dir, args.jobs)
 
     # Summary
     print(f"\nSummary:")
@@ -21,7 +21,9 @@ For all strategies: Min, Score_03, Score_05, Score_07, Avg, Rnd
 import argparse
 import json
 import pandas as pd
+import numpy as np
 import os
+from q2s_utils import load_scenarios
 
 
 def load_config(config_file):
@@ -51,20 +53,32 @@ def create_perturbation_mappings(config):
     return mappings
 
 
-def calculate_perturbation_score(row, perturbation_mappings):
-    """Calculate the total perturbation score for a row."""
-    total_score = 0
+def get_perturbation_columns(perturbation_mappings):
+    """Map each domain variable to the name of its perturbation column."""
+    return {
+        domain_variable: f"{domain_variable}_perturbation"
+        for domain_variable in perturbation_mappings
+    }
+
+
+def calculate_perturbation_scores(df, perturbation_mappings, perturbation_columns):
+    """Calculate the total perturbation score of every row, one column lookup at a time."""
+    total_score = np.zeros(len(df), dtype=int)
 
     for domain_variable, mapping in perturbation_mappings.items():
-        perturbation_col = f"{domain_variable}_perturbation"
+        perturbation_col = perturbation_columns[domain_variable]
+
+        if perturbation_col in df.columns:
+            perturbation_values = df[perturbation_col]
 
-        if perturbation_col in row:
-            perturbation_value = row[perturbation_col]
-            if perturbation_value in mapping:
-                total_score += mapping[perturbation_value]
-            else:
+            # Value -> score lookup table; unmapped values contribute 0
+            score_lookup = pd.Series(mapping)
+            known = perturbation_values.isin(score_lookup.index).to_numpy()
+            for perturbation_value in perturbation_values[~known]:
                 print(f"Warning: Perturbation value {perturbation_value} not found in mapping for {domain_variable}")
 
+            total_score = total_score + score_lookup.reindex(perturbation_values, fill_value=0).to_numpy()
+
     return total_score
 
 
@@ -78,23 +92,28 @@ def process_perturbation_severity(preprocessed_df, config):
     for domain_var, mapping in perturbation_mappings.items():
         print(f"  {domain_var}: {mapping}")
 
-    # Make a copy of the dataframe
-    result_df = preprocessed_df.copy()
+    # Perturbation column names, computed once and reused below
+    perturbation_columns = get_perturbation_columns(perturbation_mappings)
 
-    # Calculate perturbation_score for each row
-    result_df['perturbation_score'] = result_df.apply(
-        lambda row: calculate_perturbation_score(row, perturbation_mappings),
-        axis=1
-    )
+    # Score each distinct combination of perturbation values only once: there are
+    # few of them compared to the number of scenarios sharing each combination
+    present_cols = [col for col in perturbation_columns.values() if col in preprocessed_df.columns]
+    if present_cols:
+        combinations = preprocessed_df[present_cols].drop_duplicates()
+        combinations['perturbation_score'] = calculate_perturbation_scores(
+            combinations, perturbation_mappings, perturbation_columns
+        )
 
-    # Identify perturbation columns to remove
-    perturbation_cols_to_remove = []
-    for domain_variable in perturbation_mappings.keys():
-        perturbation_col = f"{domain_variable}_perturbation"
-        if perturbation_col in result_df.columns:
-            perturbation_cols_to_remove.append(perturbation_col)
+        print(f"Scored {len(combinations)} distinct perturbation combinations")
 
-    # Remove individual perturbation columns
+        # Broadcast the scores back to every scenario (left merge keeps the row order)
+        result_df = preprocessed_df.merge(combinations, on=present_cols, how='left')
+    else:
+        # No perturbation column to score: every scenario is unperturbed
+        result_df = preprocessed_df.assign(perturbation_score=0)
+
+    # Remove individual perturbation columns (the ones found above)
+    perturbation_cols_to_remove = present_cols
     result_df = result_df.drop(columns=perturbation_cols_to_remove)
 
     print(f"Removed columns: {perturbation_cols_to_remove}")
@@ -113,7 +132,7 @@ def process_perturbation_severity(preprocessed_df, config):
     desired_order.extend(['perturbation_score', 'num_valid_plans'])
 
     # Add remaining columns (strategy results)
-    remaining_cols = [col for col in result_df.columns if col not in desired_order]
+    remaining_cols = result_df.columns.difference(desired_order, sort=False)
     desired_order.extend(remaining_cols)
 
     # Reorder columns
@@ -129,11 +148,6 @@ def create_summary_multiple_perturbation(severity_df, output_dir):
     tables_dir = os.path.join(output_dir, 'tables')
     os.makedirs(tables_dir, exist_ok=True)
 
-    # Group by perturbation_score
-    grouped = severity_df.groupby('perturbation_score')
-
-    summary_rows = []
-
     # Define strategies and their column prefixes
     strategies = [
         ('Min', 'MinPlan'),
@@ -144,31 +158,34 @@ def create_summary_multiple_perturbation(severity_df, output_dir):
         ('Rnd', 'RndPlan')
     ]
 
-    for perturbation_score, group_df in grouped:
-        row = {'perturbation_score': perturbation_score}
-
-        # Calculate average success rate and average margin for each strategy
-        for strategy_name, column_prefix in strategies:
-            success_col = f"{column_prefix}_success"
-            margins_col = f"{column_prefix}_margins"
+    # Strategies whose success and margin columns are both present
+    available = [
+        column_prefix for _, column_prefix in strategies
+        if f"{column_prefix}_success" in severity_df.columns
+        and f"{column_prefix}_margins" in severity_df.columns
+    ]
+    value_cols = []
+    for column_prefix in available:
+        value_cols.extend([f"{column_prefix}_success", f"{column_prefix}_margins"])
 
-            if success_col in group_df.columns and margins_col in group_df.columns:
-                # Success rate (mean of success values, already 0/1, so mean gives the rate)
-                success_rate = group_df[success_col].mean() * 100  # Convert to percentage
+    # Average every strategy column for each perturbation_score in a single groupby
+    grouped = severity_df.groupby('perturbation_score', sort=True)[value_cols].mean()
 
-                # Average margin (mean of margin values)
-                avg_margin = group_df[margins_col].mean()
+    summary_data = {'perturbation_score': grouped.index.to_numpy()}
 
-                row[f'{strategy_name}_Success_Rate'] = success_rate
-                row[f'{strategy_name}_Average_Margin'] = avg_margin
-            else:
-                row[f'{strategy_name}_Success_Rate'] = 0.0
-                row[f'{strategy_name}_Average_Margin'] = 0.0
+    for strategy_name, column_prefix in strategies:
+        if column_prefix in available:
+            # Success rate (mean of success values, already 0/1, so mean gives the rate)
+            summary_data[f'{strategy_name}_Success_Rate'] = grouped[f"{column_prefix}_success"].to_numpy() * 100
 
-        summary_rows.append(row)
+            # Average margin (mean of margin values)
+            summary_data[f'{strategy_name}_Average_Margin'] = grouped[f"{column_prefix}_margins"].to_numpy()
+        else:
+            summary_data[f'{strategy_name}_Success_Rate'] = 0.0
+            summary_data[f'{strategy_name}_Average_Margin'] = 0.0
 
     # Create summary dataframe
-    summary_df = pd.DataFrame(summary_rows)
+    summary_df = pd.DataFrame(summary_data)
 
     # Sort by perturbation_score
     summary_df = summary_df.sort_values('perturbation_score')
@@ -210,7 +227,7 @@ def main():
 
     # Load preprocessed data
     print(f"Loading pre-processed scenarios from: {preprocessed_file}")
-    preprocessed_df = pd.read_csv(preprocessed_file)
+    preprocessed_df = load_scenarios(preprocessed_file)
 
     print(f"Loaded {len(preprocessed_df)} pre-processed scenarios")
     print(f"Input columns: {list(preprocessed_df.columns)}")
@@ -17,12 +17,33 @@ across different perturbation levels with custom labels and pastel color palette
 """
 
 import argparse
+import io
 import json
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 from pathlib import Path
+from q2s_utils import run_jobs
+
+
+# Resolution of the saved plots; main lets the Q2S_DPI environment variable override it,
+# and --publication renders them at PUBLICATION_DPI instead
+DPI = 150
+PUBLICATION_DPI = 300
+
+# Strategies with their data columns and display labels, and their pastel colors
+STRATEGIES = (
+    ('Min_Success_Rate', 'Min_Average_Margin', 'Min (α = 0)'),
+    ('Score_03_Success_Rate', 'Score_03_Average_Margin', 'α=0.3'),
+    ('Score_05_Success_Rate', 'Score_05_Average_Margin', 'α=0.5'),
+    ('Score_07_Success_Rate', 'Score_07_Average_Margin', 'α=0.7'),
+    ('Avg_Success_Rate', 'Avg_Average_Margin', 'Avg (α=1)'),
+    ('Rnd_Success_Rate', 'Rnd_Average_Margin', 'Rnd')
+)
+STRATEGY_COLORS = ('#F1948A', '#F8C471', '#A9DFBF', '#AED6F1', '#D2B4DE', '#D7C3A0')
+
+# Summary table columns drawn by the plots; the others (e.g. variances) are not read
+PLOTTED_COLUMNS = frozenset(column for strategy in STRATEGIES for column in strategy[:2])
 
 
 def load_config(config_file):
@@ -50,15 +71,107 @@ def get_perturbation_label_mapping():
     }
 
 
-def create_strategy_comparison_plots(summary_df, quality_goal, output_dir):
-    """Create comparison plots (both histogram and line chart) for a quality goal."""
+def get_plot_files(output_dir, plot_name):
+    """Return the success histogram, success line, margin histogram and margin line plot paths."""
+    plots_dir = os.path.join(output_dir, 'plots')
+    return [
+        os.path.join(plots_dir, f'{chart}_{plot_name}_{metric}.png')
+        for metric in ('success', 'margin')
+        for chart in ('histo', 'line')
+    ]
+
+
+def plots_up_to_date(plot_files, summary_file, dpi):
+    """Check whether all plots exist, are newer than their summary table and were saved at dpi."""
+    from PIL import Image, UnidentifiedImageError
+
+    summary_mtime = os.path.getmtime(summary_file)
+
+    for plot_file in plot_files:
+        if not os.path.exists(plot_file) or os.path.getmtime(plot_file) < summary_mtime:
+            return False
+        # An empty or truncated file (e.g. from an interrupted run or a full disk)
+        # is redrawn rather than aborting the run
+        try:
+            with Image.open(plot_file) as image:
+                if round(image.info.get('dpi', (0, 0))[0]) != dpi:
+                    return False
+        except (OSError, UnidentifiedImageError):
+            return False
+
+    return True
+
+
+def _pyplot():
+    """Import and return matplotlib.pyplot.
+
+    Imported here so that --help, the error paths and up-to-date runs do not pay for
+    loading matplotlib. The backend is left alone: an interactive session importing
+    these functions keeps its own, and main selects Agg through MPLBACKEND when run
+    as a script.
+    """
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def save_figure(fig, plot_file, dpi):
+    """Render a figure to PNG in memory, then move it into place in a single write.
+
+    A plot file is therefore never left half-written, which the up-to-date check
+    of main would otherwise take for a finished plot.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi)
+
+    tmp_file = plot_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(buffer.getbuffer())
+    os.replace(tmp_file, plot_file)
+
+
+def build_strategy_matrix(ordered_df, columns):
+    """Return the indices of the columns present and their (levels x strategies) values."""
+    present = [i for i, col in enumerate(columns) if col in ordered_df.columns]
+    matrix = ordered_df[[columns[i] for i in present]].to_numpy()
+    return present, matrix
+
+
+def draw_strategy_bars(ax, x_pos, width, indices, matrix, strategies, colors):
+    """Draw the grouped bars of all strategies with a single bar call.
+
+    Returns the legend handles, one per strategy drawn.
+    """
+    from matplotlib.patches import Patch
+
+    offsets = np.array(indices, dtype=float)[:, np.newaxis] * width
+    ax.bar(
+        (x_pos[np.newaxis, :] + offsets).ravel(),
+        matrix.T.ravel(),
+        width,
+        color=[colors[i] for i in indices for _ in x_pos]
+    )
+
+    return [Patch(facecolor=colors[i], label=strategies[i][2]) for i in indices]
+
+
+def create_strategy_comparison_plots(summary_df, quality_goal, output_dir, dpi=DPI, perturbation_levels=None):
+    """Create comparison plots (both histogram and line chart) for a quality goal.
+
+    perturbation_levels are the sorted distinct perturbation values of summary_df;
+    they are computed here when not given.
+    """
+    plt = _pyplot()
 
     # Create plots subdirectory
-    plots_dir = os.path.join(output_dir, 'plots')
-    os.makedirs(plots_dir, exist_ok=True)
+    os.makedirs(os.path.join(output_dir, 'plots'), exist_ok=True)
+    success_histo_file, success_line_file, margin_histo_file, margin_line_file = get_plot_files(
+        output_dir, f'single_{quality_goal}_perturbation'
+    )
 
     # Get perturbation values and sort from highest to lowest (0 on left, catastrophic on right)
-    perturbation_values = sorted(summary_df['Perturbation'].unique(), reverse=True)
+    if perturbation_levels is None:
+        perturbation_levels = np.unique(summary_df['Perturbation'].to_numpy())
+    perturbation_values = perturbation_levels[::-1]
     label_mapping = get_perturbation_label_mapping()
 
     # Create custom labels for x-axis
@@ -77,53 +190,43 @@ def create_strategy_comparison_plots(summary_df, quality_goal, output_dir):
             else:
                 x_labels.append("catastrophic")
 
-    # Define strategies with their data columns and display labels
-    strategies = [
-        ('Min_Success_Rate', 'Min_Average_Margin', 'Min (α = 0)'),
-        ('Score_03_Success_Rate', 'Score_03_Average_Margin', 'α=0.3'),
-        ('Score_05_Success_Rate', 'Score_05_Average_Margin', 'α=0.5'),
-        ('Score_07_Success_Rate', 'Score_07_Average_Margin', 'α=0.7'),
-        ('Avg_Success_Rate', 'Avg_Average_Margin', 'Avg (α=1)'),
-        ('Rnd_Success_Rate', 'Rnd_Average_Margin', 'Rnd')
-    ]
-
-    # Set up plot parameters with pastel colors
+    # Set up plot parameters
     x_pos = np.arange(len(perturbation_values))
     width = 0.13  # Width of bars
-    colors = ['#F1948A', '#F8C471', '#A9DFBF', '#AED6F1', '#D2B4DE', '#D7C3A0']  # Pastel colors
+
+    # Index the summary by perturbation value once, in plotting order
+    ordered_df = summary_df.set_index('Perturbation').loc[perturbation_values]
+
+    # Levels x strategies matrices of the success rates and average margins
+    success_indices, success_matrix = build_strategy_matrix(ordered_df, [success_col for success_col, _, _ in STRATEGIES])
+    margin_indices, margin_matrix = build_strategy_matrix(ordered_df, [margin_col for _, margin_col, _ in STRATEGIES])
 
     created_files = []
 
     # Create Success Rate HISTOGRAM
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # The constrained layout is computed while drawing, so saving needs no extra bbox pass
+    fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
 
-    for i, (success_col, _, label) in enumerate(strategies):
-        if success_col in summary_df.columns:
-            values = summary_df.set_index('Perturbation').loc[perturbation_values, success_col].values
-            ax.bar(x_pos + i * width, values, width, label=label, color=colors[i])
+    handles = draw_strategy_bars(ax, x_pos, width, success_indices, success_matrix, STRATEGIES, STRATEGY_COLORS)
 
     ax.set_xlabel(f'{quality_goal.title()} Perturbation', fontsize=12)
     ax.set_ylabel('Success Rate (%)', fontsize=12)
     ax.set_title(f'Comparison of Strategies by {quality_goal.title()} Perturbation', fontsize=14, fontweight='bold')
     ax.set_xticks(x_pos + width * 2.5)  # Center the x-tick labels
     ax.set_xticklabels(x_labels)
-    ax.legend(loc='upper right', fontsize=10)  # Changed to upper right
+    ax.legend(handles=handles, loc='upper right', fontsize=10)  # Changed to upper right
     ax.grid(True, alpha=0.3)
 
     # Save Success Rate histogram
-    success_histo_file = os.path.join(plots_dir, f'histo_single_{quality_goal}_perturbation_success.png')
-    plt.tight_layout()
-    plt.savefig(success_histo_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, success_histo_file, dpi)
     created_files.append(success_histo_file)
 
     # Create Success Rate LINE CHART
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Reuse the figure of the previous chart
+    ax.clear()
 
-    for i, (success_col, _, label) in enumerate(strategies):
-        if success_col in summary_df.columns:
-            values = summary_df.set_index('Perturbation').loc[perturbation_values, success_col].values
-            ax.plot(x_pos, values, marker='o', linewidth=2, markersize=6, label=label, color=colors[i])
+    for j, i in enumerate(success_indices):
+        ax.plot(x_pos, success_matrix[:, j], marker='o', linewidth=2, markersize=6, label=STRATEGIES[i][2], color=STRATEGY_COLORS[i])
 
     ax.set_xlabel(f'{quality_goal.title()} Perturbation', fontsize=12)
     ax.set_ylabel('Success Rate (%)', fontsize=12)
@@ -134,42 +237,33 @@ def create_strategy_comparison_plots(summary_df, quality_goal, output_dir):
     ax.grid(True, alpha=0.3)
 
     # Save Success Rate line chart
-    success_line_file = os.path.join(plots_dir, f'line_single_{quality_goal}_perturbation_success.png')
-    plt.tight_layout()
-    plt.savefig(success_line_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, success_line_file, dpi)
     created_files.append(success_line_file)
 
     # Create Average Margin HISTOGRAM
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Reuse the figure of the previous chart
+    ax.clear()
 
-    for i, (_, margin_col, label) in enumerate(strategies):
-        if margin_col in summary_df.columns:
-            values = summary_df.set_index('Perturbation').loc[perturbation_values, margin_col].values
-            ax.bar(x_pos + i * width, values, width, label=label, color=colors[i])
+    handles = draw_strategy_bars(ax, x_pos, width, margin_indices, margin_matrix, STRATEGIES, STRATEGY_COLORS)
 
     ax.set_xlabel(f'{quality_goal.title()} Perturbation', fontsize=12)
     ax.set_ylabel('Average Margin', fontsize=12)
     ax.set_title(f'Comparison of Strategies by {quality_goal.title()} Perturbation', fontsize=14, fontweight='bold')
     ax.set_xticks(x_pos + width * 2.5)  # Center the x-tick labels
     ax.set_xticklabels(x_labels)
-    ax.legend(loc='upper right', fontsize=10)  # Changed to upper right
+    ax.legend(handles=handles, loc='upper right', fontsize=10)  # Changed to upper right
     ax.grid(True, alpha=0.3)
 
     # Save Average Margin histogram
-    margin_histo_file = os.path.join(plots_dir, f'histo_single_{quality_goal}_perturbation_margin.png')
-    plt.tight_layout()
-    plt.savefig(margin_histo_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, margin_histo_file, dpi)
     created_files.append(margin_histo_file)
 
     # Create Average Margin LINE CHART
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Reuse the figure of the previous chart
+    ax.clear()
 
-    for i, (_, margin_col, label) in enumerate(strategies):
-        if margin_col in summary_df.columns:
-            values = summary_df.set_index('Perturbation').loc[perturbation_values, margin_col].values
-            ax.plot(x_pos, values, marker='o', linewidth=2, markersize=6, label=label, color=colors[i])
+    for j, i in enumerate(margin_indices):
+        ax.plot(x_pos, margin_matrix[:, j], marker='o', linewidth=2, markersize=6, label=STRATEGIES[i][2], color=STRATEGY_COLORS[i])
 
     ax.set_xlabel(f'{quality_goal.title()} Perturbation', fontsize=12)
     ax.set_ylabel('Average Margin', fontsize=12)
@@ -180,10 +274,8 @@ def create_strategy_comparison_plots(summary_df, quality_goal, output_dir):
     ax.grid(True, alpha=0.3)
 
     # Save Average Margin line chart
-    margin_line_file = os.path.join(plots_dir, f'line_single_{quality_goal}_perturbation_margin.png')
-    plt.tight_layout()
-    plt.savefig(margin_line_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, margin_line_file, dpi)
+    plt.close(fig)
     created_files.append(margin_line_file)
 
     print(f"Created plots for {quality_goal}:")
@@ -193,64 +285,62 @@ def create_strategy_comparison_plots(summary_df, quality_goal, output_dir):
     return created_files
 
 
-def create_multiple_perturbation_plots(summary_df, output_dir):
-    """Create comparison plots (both histogram and line chart) for multiple perturbation severity."""
+def create_multiple_perturbation_plots(summary_df, output_dir, dpi=DPI, perturbation_scores=None):
+    """Create comparison plots (both histogram and line chart) for multiple perturbation severity.
+
+    perturbation_scores are the sorted distinct scores of summary_df; they are computed
+    here when not given.
+    """
+    plt = _pyplot()
 
     # Create plots subdirectory
-    plots_dir = os.path.join(output_dir, 'plots')
-    os.makedirs(plots_dir, exist_ok=True)
+    os.makedirs(os.path.join(output_dir, 'plots'), exist_ok=True)
+    success_histo_file, success_line_file, margin_histo_file, margin_line_file = get_plot_files(
+        output_dir, 'multi_perturbation'
+    )
 
     # Get perturbation scores and sort from lowest to highest (0 on left, higher values on right)
-    perturbation_scores = sorted(summary_df['perturbation_score'].unique())  # Removed reverse=True
+    if perturbation_scores is None:
+        perturbation_scores = np.unique(summary_df['perturbation_score'].to_numpy())  # Removed reverse=True
     x_labels = [str(score) for score in perturbation_scores]
 
-    # Define strategies with their data columns and display labels
-    strategies = [
-        ('Min_Success_Rate', 'Min_Average_Margin', 'Min (α = 0)'),
-        ('Score_03_Success_Rate', 'Score_03_Average_Margin', 'α=0.3'),
-        ('Score_05_Success_Rate', 'Score_05_Average_Margin', 'α=0.5'),
-        ('Score_07_Success_Rate', 'Score_07_Average_Margin', 'α=0.7'),
-        ('Avg_Success_Rate', 'Avg_Average_Margin', 'Avg (α=1)'),
-        ('Rnd_Success_Rate', 'Rnd_Average_Margin', 'Rnd')
-    ]
-
-    # Set up plot parameters with same pastel colors
+    # Set up plot parameters
     x_pos = np.arange(len(perturbation_scores))
     width = 0.13  # Width of bars
-    colors = ['#F1948A', '#F8C471', '#A9DFBF', '#AED6F1', '#D2B4DE', '#D7C3A0']  # Pastel colors
+
+    # Index the summary by perturbation score once, in plotting order
+    ordered_df = summary_df.set_index('perturbation_score').loc[perturbation_scores]
+
+    # Levels x strategies matrices of the success rates and average margins
+    success_indices, success_matrix = build_strategy_matrix(ordered_df, [success_col for success_col, _, _ in STRATEGIES])
+    margin_indices, margin_matrix = build_strategy_matrix(ordered_df, [margin_col for _, margin_col, _ in STRATEGIES])
 
     created_files = []
 
     # Create Success Rate HISTOGRAM
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # The constrained layout is computed while drawing, so saving needs no extra bbox pass
+    fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
 
-    for i, (success_col, _, label) in enumerate(strategies):
-        if success_col in summary_df.columns:
-            values = summary_df.set_index('perturbation_score').loc[perturbation_scores, success_col].values
-            ax.bar(x_pos + i * width, values, width, label=label, color=colors[i])
+    handles = draw_strategy_bars(ax, x_pos, width, success_indices, success_matrix, STRATEGIES, STRATEGY_COLORS)
 
     ax.set_xlabel('Global Perturbation Severity', fontsize=12)
     ax.set_ylabel('Success Rate (%)', fontsize=12)
     ax.set_title('Comparison of Strategies by Global Perturbation', fontsize=14, fontweight='bold')
     ax.set_xticks(x_pos + width * 2.5)  # Center the x-tick labels
     ax.set_xticklabels(x_labels)
-    ax.legend(loc='upper right', fontsize=10)  # Changed to upper right
+    ax.legend(handles=handles, loc='upper right', fontsize=10)  # Changed to upper right
     ax.grid(True, alpha=0.3)
 
     # Save Success Rate histogram
-    success_histo_file = os.path.join(plots_dir, 'histo_multi_perturbation_success.png')
-    plt.tight_layout()
-    plt.savefig(success_histo_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, success_histo_file, dpi)
     created_files.append(success_histo_file)
 
     # Create Success Rate LINE CHART
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Reuse the figure of the previous chart
+    ax.clear()
 
-    for i, (success_col, _, label) in enumerate(strategies):
-        if success_col in summary_df.columns:
-            values = summary_df.set_index('perturbation_score').loc[perturbation_scores, success_col].values
-            ax.plot(x_pos, values, marker='o', linewidth=2, markersize=6, label=label, color=colors[i])
+    for j, i in enumerate(success_indices):
+        ax.plot(x_pos, success_matrix[:, j], marker='o', linewidth=2, markersize=6, label=STRATEGIES[i][2], color=STRATEGY_COLORS[i])
 
     ax.set_xlabel('Global Perturbation Severity', fontsize=12)
     ax.set_ylabel('Success Rate (%)', fontsize=12)
@@ -261,42 +351,33 @@ def create_multiple_perturbation_plots(summary_df, output_dir):
     ax.grid(True, alpha=0.3)
 
     # Save Success Rate line chart
-    success_line_file = os.path.join(plots_dir, 'line_multi_perturbation_success.png')
-    plt.tight_layout()
-    plt.savefig(success_line_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, success_line_file, dpi)
     created_files.append(success_line_file)
 
     # Create Average Margin HISTOGRAM
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Reuse the figure of the previous chart
+    ax.clear()
 
-    for i, (_, margin_col, label) in enumerate(strategies):
-        if margin_col in summary_df.columns:
-            values = summary_df.set_index('perturbation_score').loc[perturbation_scores, margin_col].values
-            ax.bar(x_pos + i * width, values, width, label=label, color=colors[i])
+    handles = draw_strategy_bars(ax, x_pos, width, margin_indices, margin_matrix, STRATEGIES, STRATEGY_COLORS)
 
     ax.set_xlabel('Global Perturbation Severity', fontsize=12)
     ax.set_ylabel('Average Margin', fontsize=12)
     ax.set_title('Comparison of Strategies by Global Perturbation', fontsize=14, fontweight='bold')
     ax.set_xticks(x_pos + width * 2.5)  # Center the x-tick labels
     ax.set_xticklabels(x_labels)
-    ax.legend(loc='upper right', fontsize=10)  # Changed to upper right
+    ax.legend(handles=handles, loc='upper right', fontsize=10)  # Changed to upper right
     ax.grid(True, alpha=0.3)
 
     # Save Average Margin histogram
-    margin_histo_file = os.path.join(plots_dir, 'histo_multi_perturbation_margin.png')
-    plt.tight_layout()
-    plt.savefig(margin_histo_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, margin_histo_file, dpi)
     created_files.append(margin_histo_file)
 
     # Create Average Margin LINE CHART
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Reuse the figure of the previous chart
+    ax.clear()
 
-    for i, (_, margin_col, label) in enumerate(strategies):
-        if margin_col in summary_df.columns:
-            values = summary_df.set_index('perturbation_score').loc[perturbation_scores, margin_col].values
-            ax.plot(x_pos, values, marker='o', linewidth=2, markersize=6, label=label, color=colors[i])
+    for j, i in enumerate(margin_indices):
+        ax.plot(x_pos, margin_matrix[:, j], marker='o', linewidth=2, markersize=6, label=STRATEGIES[i][2], color=STRATEGY_COLORS[i])
 
     ax.set_xlabel('Global Perturbation Severity', fontsize=12)
     ax.set_ylabel('Average Margin', fontsize=12)
@@ -307,10 +388,8 @@ def create_multiple_perturbation_plots(summary_df, output_dir):
     ax.grid(True, alpha=0.3)
 
     # Save Average Margin line chart
-    margin_line_file = os.path.join(plots_dir, 'line_multi_perturbation_margin.png')
-    plt.tight_layout()
-    plt.savefig(margin_line_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, margin_line_file, dpi)
+    plt.close(fig)
     created_files.append(margin_line_file)
 
     print(f"Created multiple perturbation plots:")
@@ -328,6 +407,22 @@ def main():
         'config_file',
         help='Path to the configuration JSON file'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of worker processes used to render the plots (default: number of CPUs)'
+    )
+    parser.add_argument(
+        '--publication',
+        action='store_true',
+        help=f'Save the plots at {PUBLICATION_DPI} dpi instead of {DPI} dpi (or $Q2S_DPI)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Redraw the plots even if they are newer than their summary tables'
+    )
 
     args = parser.parse_args()
 
@@ -341,10 +436,27 @@ def main():
     # Get quality goals from config
     quality_goals = config.get('quality_goals', [])
 
-    print(f"Creating visualization plots (histograms and line charts)...")
+    # The environment override is checked here, so a bad value is a usage error
+    default_dpi = DPI
+    env_dpi = os.environ.get('Q2S_DPI')
+    if env_dpi is not None:
+        try:
+            default_dpi = int(env_dpi)
+        except ValueError:
+            default_dpi = 0
+        if default_dpi <= 0:
+            parser.error(f"Q2S_DPI must be a positive integer, got {env_dpi!r}")
+
+    dpi = PUBLICATION_DPI if args.publication else default_dpi
+
+    print(f"Creating visualization plots (histograms and line charts) at {dpi} dpi...")
 
     created_plots = []
 
+    # Each summary table is rendered independently: collect one plotting job per table
+    # and draw them in worker processes afterwards
+    plot_jobs = []
+
     # Process each quality goal (single perturbation plots)
     if quality_goals:
         print(f"\nCreating single perturbation plots for {len(quality_goals)} quality goals...")
@@ -364,33 +476,62 @@ def main():
                 print(f"Warning: Summary file not found: {summary_file}")
                 continue
 
+            if not args.force and plots_up_to_date(
+                get_plot_files(output_dir, f'single_{quality_goal}_perturbation'), summary_file, dpi
+            ):
+                print(f"\nPlots for {quality_goal} are up to date, skipping (use --force to redraw)")
+                continue
+
             print(f"\nProcessing {quality_goal}...")
-            summary_df = pd.read_csv(summary_file)
+            summary_df = pd.read_csv(summary_file, usecols=lambda col: col == 'Perturbation' or col in PLOTTED_COLUMNS)
 
             print(f"Loaded summary data: {len(summary_df)} perturbation levels")
-            print(f"Perturbation values: {sorted(summary_df['Perturbation'].unique())}")
+            # Sorted perturbation levels, shared by the log and the plots
+            perturbation_levels = np.unique(summary_df['Perturbation'].to_numpy())
+            print(f"Perturbation values: {perturbation_levels.tolist()}")
 
             # Create plots
-            plot_files = create_strategy_comparison_plots(summary_df, quality_goal, output_dir)
-            created_plots.extend(plot_files)
+            plot_jobs.append(
+                (create_strategy_comparison_plots, summary_df, quality_goal, output_dir, dpi, perturbation_levels)
+            )
 
     # Process multiple perturbation plot
     print(f"\nCreating multiple perturbation plots...")
     multiple_summary_file = os.path.join(tables_dir, 'summary_multiple_perturbation.csv')
 
-    if os.path.exists(multiple_summary_file):
+    if os.path.exists(multiple_summary_file) and not args.force and plots_up_to_date(
+        get_plot_files(output_dir, 'multi_perturbation'), multiple_summary_file, dpi
+    ):
+        print("Multiple perturbation plots are up to date, skipping (use --force to redraw)")
+    elif os.path.exists(multiple_summary_file):
         print(f"Loading multiple perturbation summary data...")
-        multiple_summary_df = pd.read_csv(multiple_summary_file)
+        multiple_summary_df = pd.read_csv(
+            multiple_summary_file, usecols=lambda col: col == 'perturbation_score' or col in PLOTTED_COLUMNS
+        )
 
         print(f"Loaded multiple perturbation data: {len(multiple_summary_df)} severity levels")
-        print(f"Perturbation scores: {sorted(multiple_summary_df['perturbation_score'].unique())}")
+        # Sorted perturbation scores, shared by the log and the plots
+        perturbation_scores = np.unique(multiple_summary_df['perturbation_score'].to_numpy())
+        print(f"Perturbation scores: {perturbation_scores.tolist()}")
 
         # Create multiple perturbation plots
-        plot_files = create_multiple_perturbation_plots(multiple_summary_df, output_dir)
-        created_plots.extend(plot_files)
+        plot_jobs.append(
+            (create_multiple_perturbation_plots, multiple_summary_df, output_dir, dpi, perturbation_scores)
+        )
     else:
         print(f"Warning: Multiple perturbation summary file not found: {multiple_summary_file}")
 
+    if plot_jobs:
+        # The plots are only written to files, so the non-interactive Agg backend is
+        # enough. It is set through the environment, which worker processes inherit
+        # whatever their start method, unless MPLBACKEND already names a backend
+        os.environ.setdefault('MPLBACKEND', 'Agg')
+        import matplotlib
+        matplotlib.use(os.environ['MPLBACKEND'])
+
+        for plot_files in run_jobs(plot_jobs, args.jobs or os.cpu_count()):
+            created_plots.extend(plot_files)
+
     # Summary
     print(f"\n" + "="*50)
     print(f"Visualization complete!")
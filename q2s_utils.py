@@ -1,6 +1,8 @@
+import hashlib
 import json
 import pandas as pd
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 def load_json_config(config_filename):
     """
@@ -33,6 +35,200 @@ def load_json_config(config_filename):
 
 
 
+def get_file_cache_key(*file_paths):
+    """
+    Build a cache key that changes whenever any of the given files changes.
+
+    Each file contributes its absolute path, exact modification time (in
+    nanoseconds) and size, so a cached result stays valid only while all of its
+    input files are untouched. Replacing a file with another one of a different
+    age (e.g. copied with cp -p) changes the key too.
+
+    Args:
+        *file_paths (str): Paths of the input files the cached result depends on
+
+    Returns:
+        str: Hex digest identifying the current state of the input files
+    """
+    digest = hashlib.sha1()
+
+    for file_path in file_paths:
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        digest.update(f"{abs_path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+
+    return digest.hexdigest()
+
+
+def read_cached_frame(cache_path, cache_key):
+    """
+    Read a dataframe stored by write_cached_frame, if it was stored under the given key.
+
+    Args:
+        cache_path (str): Path of the cache file
+        cache_key (str): Key the cached frame must have been stored with
+
+    Returns:
+        pandas.DataFrame: The cached frame, or None if the cache file is missing,
+        unreadable or stored under another key
+    """
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        cached = pd.read_pickle(cache_path)
+    except Exception as e:
+        print(f"Warning: ignoring unreadable cache file {cache_path}: {e}")
+        return None
+
+    if not isinstance(cached, dict) or cached.get("key") != cache_key:
+        return None
+
+    return cached["frame"]
+
+
+def write_cached_frame(cache_path, cache_key, frame):
+    """
+    Store a dataframe with the key it is valid for, overwriting any previous entry.
+
+    Caching is best-effort: if the cache file cannot be written (e.g. a read-only
+    data directory) a warning is printed and the caller carries on.
+
+    Args:
+        cache_path (str): Path of the cache file
+        cache_key (str): Key identifying the inputs the frame was computed from
+        frame (pandas.DataFrame): The dataframe to cache
+    """
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        pd.to_pickle({"key": cache_key, "frame": frame}, cache_path)
+    except OSError as e:
+        print(f"Warning: could not write cache file {cache_path}: {e}")
+
+
+def run_jobs(jobs, max_workers):
+    """
+    Run independent jobs, in worker processes when more than one worker is allowed.
+
+    Args:
+        jobs (list): Jobs as (function, *args) tuples; the functions and their
+            arguments must be picklable to run in worker processes
+        max_workers (int): Maximum number of worker processes
+
+    Returns:
+        list: The result of each job, in the order the jobs were given
+    """
+    # No more workers than jobs; results are gathered in submission order
+    max_workers = min(len(jobs), max_workers or 1)
+    if max_workers <= 1:
+        return [function(*args) for function, *args in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(*job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def get_scenario_dtypes(columns):
+    """
+    Build the dtype mapping for the known columns of a scenarios CSV file.
+
+    The scenarios files written by the pipeline have a stable schema, so the
+    types of the plan ID, margin and bookkeeping columns can be given to the
+    CSV parser instead of being inferred on every load. Constraint and
+    perturbation columns are left to inference because their values come from
+    the configuration file and may be integers or floats.
+
+    Args:
+        columns (list): Column names found in the CSV header
+
+    Returns:
+        dict: Mapping from column name to dtype
+
+    Example:
+        Input columns:
+        ["ID", "alpha", "cost_constraint", "ScorePlan_ID", "ScorePlan_margins"]
+
+        Output:
+        {
+          "ID": "int64",
+          "alpha": "float64",
+          "ScorePlan_ID": "object",
+          "ScorePlan_margins": "float64"
+        }
+    """
+    dtypes = {}
+
+    for col in columns:
+        if col == "ID":
+            dtypes[col] = "int64"
+        elif col == "num_valid_plans":
+            # Bounded by the number of plans in the domain
+            dtypes[col] = "int32"
+        elif col == "alpha" or col.endswith("_margins"):
+            dtypes[col] = "float64"
+        elif col.endswith("Plan_ID"):
+            dtypes[col] = "object"
+
+    return dtypes
+
+
+def load_scenarios(file_path, use_cache=True):
+    """
+    Load a scenarios CSV file (raw or pre-processed) with explicit column types.
+
+    Unless use_cache is False, the parsed frame is stored in a pickle file next to
+    the CSV file, stamped with the exact modification time and size of the CSV
+    file, and reused by later loads only while the CSV file still has that stamp.
+
+    Args:
+        file_path (str): Path to the scenarios CSV file
+        use_cache (bool): Whether to reuse and write the parsed-frame pickle
+
+    Returns:
+        pandas.DataFrame: The scenarios, one row per scenario
+    """
+    cache_path = file_path + ".pkl"
+    cache_key = get_file_cache_key(file_path)
+
+    # Reuse the parsed frame if it was stored for this exact CSV file
+    if use_cache:
+        scenarios_df = read_cached_frame(cache_path, cache_key)
+        if scenarios_df is not None:
+            return scenarios_df
+
+    # Read the header only to build the dtype mapping
+    columns = pd.read_csv(file_path, nrows=0).columns
+    scenarios_df = pd.read_csv(file_path, dtype=get_scenario_dtypes(columns))
+
+    # Success flags are 0/1: store them in one byte each unless some are missing
+    # (a missing flag keeps its column as float64 with NaN)
+    for col in scenarios_df.columns:
+        if col.endswith("_success") and scenarios_df[col].notna().all():
+            scenarios_df[col] = scenarios_df[col].astype("int8")
+
+    if use_cache:
+        write_cached_frame(cache_path, cache_key, scenarios_df)
+
+    return scenarios_df
+
+
+def save_scenarios(scenarios_df, file_path):
+    """
+    Save a scenarios dataframe as CSV, together with the parsed-frame cache used by load_scenarios.
+
+    Writing the cache right away lets the next step load the frame without parsing
+    the CSV file it was just written to.
+
+    Args:
+        scenarios_df (pandas.DataFrame): The scenarios, one row per scenario
+        file_path (str): Path of the CSV file to write
+    """
+    scenarios_df.to_csv(file_path, index=False)
+
+    # Stamped with the CSV file just written, the same rule load_scenarios checks
+    write_cached_frame(file_path + ".pkl", get_file_cache_key(file_path), scenarios_df)
+
+
 def load_plans(file_path):
     """
     Load plans from a CSV file.